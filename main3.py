@@ -1,15 +1,135 @@
 from kivy.app import App
 from kivy.uix.widget import Widget
-from kivy.graphics import Line, Color, Ellipse, Rectangle, Triangle
+from kivy.graphics import Line, Color, Ellipse, Rectangle, Triangle, Canvas, Mesh
+from kivy.graphics import Fbo, ClearColor, ClearBuffers, Callback
+from kivy.graphics.opengl import (glBlendFunc, glBlendFuncSeparate,
+                                  GL_ONE, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 from kivy.clock import Clock
 from kivy.uix.floatlayout import FloatLayout
 from kivy.core.text import Label as CoreLabel
 import math
 import random
+from bisect import bisect_left, bisect_right
+from collections import deque
+from functools import lru_cache
 from kivy.graphics.context_instructions import PushMatrix, PopMatrix, Rotate
 # Add MPU6050 imports
 import smbus2 as smbus
+from smbus2 import i2c_msg
+import struct
+import threading
 import time
+from typing import NamedTuple
+
+def _render_label(text, font_size):
+    """Render a text label; callers cache the CoreLabel itself because its
+    texture only holds a weak reference to the label's reload callback"""
+    label = CoreLabel(text=text, font_size=font_size)
+    label.refresh()
+    return label
+
+# Label textures are rendered once per distinct (text, font size). Fixed
+# labels (titles, scale and tick marks) are a small closed set and stay
+# cached for good, since the baked background keeps using them after a
+# resize. Per-frame readouts are quantized (int heading, speed and altitude,
+# 0.1 degree attitude) and get their own small LRU, where the value on screen
+# is always among the most recently used entries
+_static_label = lru_cache(maxsize=None)(_render_label)
+_readout_label = lru_cache(maxsize=256)(_render_label)
+
+def _label_texture(text, font_size):
+    """Return the texture of a cached fixed label"""
+    return _static_label(text, font_size).texture
+
+def _readout_texture(text, font_size):
+    """Return the texture of a cached per-frame readout"""
+    return _readout_label(text, font_size).texture
+
+# Blend modes for the baked background layer: strokes rendered into the
+# offscreen texture accumulate coverage in its alpha channel (leaving the color
+# premultiplied), and the texture is then composited as premultiplied alpha
+def _blend_into_texture(instruction):
+    glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+
+def _blend_premultiplied(instruction):
+    glBlendFunc(GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+
+def _blend_default(instruction):
+    # Kivy's own default state, restored exactly
+    glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE)
+
+# Radians to degrees as a single multiply
+_RAD2DEG = 180.0 / math.pi
+
+def _complementary_filter(ax, ay, az, gx, gy, gz, roll, pitch, yaw, dt):
+    """Advance the complementary filter one step; returns the new (roll, pitch, yaw)"""
+    # Calculate angles from accelerometer
+    accel_roll = math.atan2(ay, az) * _RAD2DEG
+    accel_pitch = math.atan2(-ax, math.sqrt(ay*ay + az*az)) * _RAD2DEG
+    
+    # Complementary filter - combine accelerometer and gyro data
+    # Higher filter_coef = more gyro influence = smoother but may drift
+    # Lower filter_coef = more accel influence = less drift but more noise
+    # 0.995 per sample at the original 30 Hz (increased from 0.98 for much more
+    # filtering), i.e. tau ~= 6.6 s; scaled by dt so the smoothing holds at any rate
+    filter_coef = 0.995 ** (dt * 30)
+    
+    # Scale down gyro influence significantly
+    gyro_scale = 0.3  # Reduce gyro influence by 70%
+    
+    roll = filter_coef * (roll + gx * dt * gyro_scale) + (1 - filter_coef) * accel_roll
+    pitch = filter_coef * (pitch + gy * dt * gyro_scale) + (1 - filter_coef) * accel_pitch
+    
+    # For yaw, drastically reduce sensitivity
+    yaw += gz * dt * 0.1  # Reduced from 0.3 to 0.1
+    
+    return roll, pitch, yaw
+
+# Hexagon vertex directions (pointy-top), shared by every cell of the grid
+_HEX_CS = tuple((math.cos(math.radians(60 * i + 30)), math.sin(math.radians(60 * i + 30)))
+                for i in range(6))
+
+# Reticle tick directions, one every 30 degrees
+_RETICLE_TICKS = tuple((math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+                       for angle in range(0, 360, 30))
+
+# Roll scale ticks as (roll angle, cos, sin), offset by -90 to start at the top
+_ROLL_TICKS = tuple((roll_angle, math.cos(math.radians(roll_angle - 90)), math.sin(math.radians(roll_angle - 90)))
+                    for roll_angle in range(-60, 61, 10))
+
+# Reticle cardinal triangles as (direction x, direction y, vertex offsets
+# in units of the triangle size), each pointing away from the center
+_CARDINAL_TRIS = (
+    (1, 0, (0, -0.5, 0, 0.5, 1, 0)),    # Right
+    (0, 1, (-0.5, 0, 0.5, 0, 0, 1)),    # Top
+    (-1, 0, (0, -0.5, 0, 0.5, -1, 0)),  # Left
+    (0, -1, (-0.5, 0, 0.5, 0, 0, -1))   # Bottom
+)
+
+# Sensor results are small immutable tuples with named fields
+class Vector3(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+class Attitude(NamedTuple):
+    pitch: float
+    roll: float
+    yaw: float
+
+class SensorSample(NamedTuple):
+    accel: Vector3
+    gyro: Vector3
+    temp: float
+    attitude: Attitude
+    speed: float
+
+# Shared results for the no-sensor and error paths; tuples are immutable, so
+# one instance of each serves every caller
+_ZERO_RAW = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+_ZERO_VECTOR = Vector3(0.0, 0.0, 0.0)
+_ZERO_ATTITUDE = Attitude(0.0, 0.0, 0.0)
+_ZERO_SAMPLE = SensorSample(_ZERO_VECTOR, _ZERO_VECTOR, 0.0, _ZERO_ATTITUDE, 0.0)
 
 # MPU6050 Class for handling sensor data
 class MPU6050:
@@ -20,16 +140,23 @@ class MPU6050:
         self.power_mgmt_1 = 0x6b
         self.power_mgmt_2 = 0x6c
         
-        # For filtering and smoothing
-        self.last_accel = {'x': 0, 'y': 0, 'z': 0}
-        self.last_gyro = {'x': 0, 'y': 0, 'z': 0}
+        # For filtering and smoothing ([x, y, z] per sensor)
+        self.last_accel = [0.0, 0.0, 0.0]
+        self.last_gyro = [0.0, 0.0, 0.0]
         self.filtered_pitch = 0
         self.filtered_roll = 0
         self.filtered_yaw = 0
         
         # Previous readings for damping
-        self.prev_accel = {'x': 0, 'y': 0, 'z': 0}
-        self.prev_gyro = {'x': 0, 'y': 0, 'z': 0}
+        self.prev_accel = [0.0, 0.0, 0.0]
+        self.prev_gyro = [0.0, 0.0, 0.0]
+        
+        # Latest filtered sample; the polling thread replaces it wholesale so
+        # readers on the UI thread always see a consistent snapshot
+        self.poll_interval = 1/100.0  # 100 Hz sensor polling
+        self._snapshot = _ZERO_SAMPLE
+        self._stop_event = threading.Event()
+        self._last_error_time = float('-inf')
         
         # Initialize I2C bus
         try:
@@ -41,164 +168,180 @@ class MPU6050:
         except Exception as e:
             print(f"Failed to initialize MPU6050: {e}")
             self.sensor_available = False
+        
+        # Poll the sensor in the background so I2C latency never blocks rendering
+        if self.sensor_available:
+            threading.Thread(target=self._poll_loop, daemon=True).start()
     
     def read_word(self, register):
-        """Read a word from the MPU6050"""
+        """Read a single word from the MPU6050; sampling goes through read_all"""
         if not self.sensor_available:
             return 0
         try:
-            high = self.bus.read_byte_data(self.device_address, register)
-            low = self.bus.read_byte_data(self.device_address, register + 1)
-            value = (high << 8) + low
-            if value >= 0x8000:
-                return -((65535 - value) + 1)
-            else:
-                return value
+            # Register write + 2-byte read as one combined transaction (repeated start)
+            write = i2c_msg.write(self.device_address, [register])
+            read = i2c_msg.read(self.device_address, 2)
+            self.bus.i2c_rdwr(write, read)
+            high, low = list(read)
+            # Branchless two's-complement sign extension of the 16-bit value
+            return (((high << 8) | low) ^ 0x8000) - 0x8000
         except Exception as e:
             print(f"Error reading from sensor: {e}")
             return 0
     
-    def read_accel_data(self):
-        """Read accelerometer data with heavy filtering"""
+    def read_all(self):
+        """Read accel, temp and gyro registers (0x3B-0x48) in one block transfer"""
         if not self.sensor_available:
-            return {'x': 0, 'y': 0, 'z': 0}
+            return _ZERO_RAW
         try:
-            # Read raw data
-            accel_x = self.read_word(0x3b) / 16384.0
-            accel_y = self.read_word(0x3d) / 16384.0
-            accel_z = self.read_word(0x3f) / 16384.0
+            # The register pointer auto-increments, so one transaction returns all 14 bytes
+            data = self.bus.read_i2c_block_data(self.device_address, 0x3b, 14)
+            ax, ay, az, temp, gx, gy, gz = struct.unpack('>hhhhhhh', bytes(data))
+            return (ax / 16384.0, ay / 16384.0, az / 16384.0,
+                    temp / 340.0 + 36.53,
+                    gx / 131.0, gy / 131.0, gz / 131.0)
+        except Exception as e:
+            self._log_error(f"Error reading from sensor: {e}")
+            return _ZERO_RAW
+    
+    def _log_error(self, message):
+        """Print a sampling error, at most once a second"""
+        # A failing bus or filter step fails on every poll, so repeats are dropped
+        now = time.monotonic()
+        if now - self._last_error_time >= 1.0:
+            self._last_error_time = now
+            print(message)
+    
+    def read_accel_data(self, raw=None, dt=1/30.0):
+        """Read accelerometer data with heavy filtering"""
+        if not self.sensor_available:
+            return _ZERO_VECTOR
+        # Only the polling thread feeds the filter; other callers get its last result
+        if raw is None:
+            return self._snapshot.accel
+        # Filter state is kept as [x, y, z] lists that are updated in place
+        prev = self.prev_accel
+        last = self.last_accel
+        dead_zone = 0.05
+        # Very strong low pass: tau = 0.65 s matches the original alpha = 0.05 at 30 Hz,
+        # and deriving alpha from dt keeps the smoothing independent of the poll rate
+        alpha = 1 - math.exp(-dt / 0.65)
+        for i in range(3):
+            accel = raw[i]
             
             # Apply very strong dead zone filter first
-            dead_zone = 0.05
-            if abs(accel_x - self.prev_accel['x']) < dead_zone: accel_x = self.prev_accel['x']
-            if abs(accel_y - self.prev_accel['y']) < dead_zone: accel_y = self.prev_accel['y']
-            if abs(accel_z - self.prev_accel['z']) < dead_zone: accel_z = self.prev_accel['z']
+            if abs(accel - prev[i]) < dead_zone: accel = prev[i]
             
             # Update previous values
-            self.prev_accel = {'x': accel_x, 'y': accel_y, 'z': accel_z}
+            prev[i] = accel
             
             # Apply very strong low pass filter - much lower alpha for more filtering
-            alpha = 0.05  # Very low value = very strong filtering (0.01 to 0.1 range)
-            self.last_accel['x'] = alpha * accel_x + (1 - alpha) * self.last_accel['x']
-            self.last_accel['y'] = alpha * accel_y + (1 - alpha) * self.last_accel['y']
-            self.last_accel['z'] = alpha * accel_z + (1 - alpha) * self.last_accel['z']
-            
-            return self.last_accel
-        except Exception as e:
-            print(f"Error reading accelerometer data: {e}")
-            return {'x': 0, 'y': 0, 'z': 0}
+            last[i] = alpha * accel + (1 - alpha) * last[i]
+        
+        return Vector3._make(last)
     
-    def read_gyro_data(self):
+    def read_gyro_data(self, raw=None, dt=1/30.0):
         """Read gyroscope data with heavy filtering"""
         if not self.sensor_available:
-            return {'x': 0, 'y': 0, 'z': 0}
-        try:
-            # Read raw data
-            gyro_x = self.read_word(0x43) / 131.0
-            gyro_y = self.read_word(0x45) / 131.0
-            gyro_z = self.read_word(0x47) / 131.0
+            return _ZERO_VECTOR
+        # Only the polling thread feeds the filter; other callers get its last result
+        if raw is None:
+            return self._snapshot.gyro
+        # Filter state is kept as [x, y, z] lists that are updated in place
+        prev = self.prev_gyro
+        last = self.last_gyro
+        dead_zone = 1.5  # Increased from 0.5 to 1.5
+        max_change = 60.0 * dt  # deg/s per sample; 2.0 at the original 30 Hz
+        alpha = 1 - math.exp(-dt / 0.65)  # Same time constant as the accelerometer
+        for i in range(3):
+            gyro = raw[4 + i]
             
             # Apply much larger dead zone filter to reduce noise when stationary
-            dead_zone = 1.5  # Increased from 0.5 to 1.5
-            if abs(gyro_x) < dead_zone: gyro_x = 0
-            if abs(gyro_y) < dead_zone: gyro_y = 0
-            if abs(gyro_z) < dead_zone: gyro_z = 0
+            if abs(gyro) < dead_zone: gyro = 0
             
             # Apply rate limiter to prevent sudden jumps in gyro readings
-            max_change = 2.0
-            if abs(gyro_x - self.prev_gyro['x']) > max_change:
-                gyro_x = self.prev_gyro['x'] + max_change * (1 if gyro_x > self.prev_gyro['x'] else -1)
-            if abs(gyro_y - self.prev_gyro['y']) > max_change:
-                gyro_y = self.prev_gyro['y'] + max_change * (1 if gyro_y > self.prev_gyro['y'] else -1)
-            if abs(gyro_z - self.prev_gyro['z']) > max_change:
-                gyro_z = self.prev_gyro['z'] + max_change * (1 if gyro_z > self.prev_gyro['z'] else -1)
+            if abs(gyro - prev[i]) > max_change:
+                gyro = prev[i] + max_change * (1 if gyro > prev[i] else -1)
             
             # Update previous values
-            self.prev_gyro = {'x': gyro_x, 'y': gyro_y, 'z': gyro_z}
+            prev[i] = gyro
             
             # Apply very low pass filter with more aggressive filtering
-            alpha = 0.05  # Lower = more filtering
-            self.last_gyro['x'] = alpha * gyro_x + (1 - alpha) * self.last_gyro['x']
-            self.last_gyro['y'] = alpha * gyro_y + (1 - alpha) * self.last_gyro['y']
-            self.last_gyro['z'] = alpha * gyro_z + (1 - alpha) * self.last_gyro['z']
-            
-            return self.last_gyro
-        except Exception as e:
-            print(f"Error reading gyroscope data: {e}")
-            return {'x': 0, 'y': 0, 'z': 0}
+            last[i] = alpha * gyro + (1 - alpha) * last[i]
+        
+        return Vector3._make(last)
     
     def read_temp_data(self):
         """Read temperature data"""
         if not self.sensor_available:
             return 0
-        try:
-            temp = self.read_word(0x41) / 340.0 + 36.53  # Formula from datasheet
-            return temp
-        except Exception as e:
-            print(f"Error reading temperature data: {e}")
-            return 0
+        # Converted by read_all (formula from datasheet) as part of the block read
+        return self._snapshot.temp
     
-    def get_rotation_angles(self):
+    def get_rotation_angles(self, accel=None, gyro=None, dt=1/30.0):
         """Calculate pitch and roll using complementary filter with reduced sensitivity"""
         if not self.sensor_available:
-            return {'pitch': 0, 'roll': 0, 'yaw': 0}
-        try:
-            accel = self.read_accel_data()
-            gyro = self.read_gyro_data()
-            
-            # Calculate angles from accelerometer
-            accel_roll = math.atan2(accel['y'], accel['z']) * 180/math.pi
-            accel_pitch = math.atan2(-accel['x'], math.sqrt(accel['y']*accel['y'] + accel['z']*accel['z'])) * 180/math.pi
-            
-            # Get time difference (assuming a fixed update rate)
-            dt = 1/30.0  # 30 Hz update rate
-            
-            # Complementary filter - combine accelerometer and gyro data
-            # Higher filter_coef = more gyro influence = smoother but may drift
-            # Lower filter_coef = more accel influence = less drift but more noise
-            filter_coef = 0.995  # Increased from 0.98 for much more filtering
-            
-            # Scale down gyro influence significantly
-            gyro_scale = 0.3  # Reduce gyro influence by 70%
-            
-            self.filtered_roll = filter_coef * (self.filtered_roll + gyro['x'] * dt * gyro_scale) + (1 - filter_coef) * accel_roll
-            self.filtered_pitch = filter_coef * (self.filtered_pitch + gyro['y'] * dt * gyro_scale) + (1 - filter_coef) * accel_pitch
-            
-            # For yaw, drastically reduce sensitivity
-            self.filtered_yaw += gyro['z'] * dt * 0.1  # Reduced from 0.3 to 0.1
-            
-            return {
-                'pitch': self.filtered_pitch, 
-                'roll': self.filtered_roll, 
-                'yaw': self.filtered_yaw
-            }
-        except Exception as e:
-            print(f"Error calculating rotation angles: {e}")
-            return {'pitch': 0, 'roll': 0, 'yaw': 0}
+            return _ZERO_ATTITUDE
+        if accel is None or gyro is None:
+            return self._snapshot.attitude
+        self.filtered_roll, self.filtered_pitch, self.filtered_yaw = _complementary_filter(
+            *accel, *gyro,
+            self.filtered_roll, self.filtered_pitch, self.filtered_yaw, dt)
+        
+        return Attitude(self.filtered_pitch, self.filtered_roll, self.filtered_yaw)
     
-    def estimate_speed(self):
+    def estimate_speed(self, accel=None):
         """Estimate relative speed with extremely reduced sensitivity"""
         if not self.sensor_available:
             return 0
-        try:
-            accel = self.read_accel_data()
-            
-            # Calculate acceleration magnitude (removing gravity)
-            accel_z_without_gravity = accel['z'] - 1.0  # Remove 1g (approximation)
-            magnitude = math.sqrt(accel['x']**2 + accel['y']**2 + accel_z_without_gravity**2)
+        if accel is None:
+            return self._snapshot.speed
+        # Calculate acceleration magnitude (removing gravity)
+        ax, ay, az = accel
+        az -= 1.0  # Remove 1g (approximation)
+        magnitude = math.sqrt(ax*ax + ay*ay + az*az)
+        
+        # Use a much larger dead zone to filter out small movements
+        if magnitude < 0.1:  # Increased from 0.05
+            magnitude = 0
             
-            # Use a much larger dead zone to filter out small movements
-            if magnitude < 0.1:  # Increased from 0.05
-                magnitude = 0
-                
-            # Drastically reduced sensitivity
-            speed = magnitude * 10  # Reduced from 25 to 10
+        # Drastically reduced sensitivity
+        speed = magnitude * 10  # Reduced from 25 to 10
+        
+        # Smoothly approach the target speed rather than jump
+        return max(0, min(200, speed))  # Clamp between 0-200
+    
+    def _poll_loop(self):
+        """Read and filter the sensor every poll_interval until stop() is called"""
+        last_time = time.monotonic()
+        while not self._stop_event.wait(self.poll_interval):
+            # Filters are driven by the measured sample spacing, not the nominal rate
+            now = time.monotonic()
+            dt = now - last_time
+            last_time = now
             
-            # Smoothly approach the target speed rather than jump
-            return max(0, min(200, speed))  # Clamp between 0-200
-        except Exception as e:
-            print(f"Error estimating speed: {e}")
-            return 0
+            # One error boundary for the whole poll (read_all handles bus errors
+            # itself); an unexpected failure must not end the thread and leave
+            # the HUD showing a frozen snapshot
+            try:
+                raw = self.read_all()
+                accel = self.read_accel_data(raw, dt)
+                gyro = self.read_gyro_data(raw, dt)
+                # The readers return immutable copies of their state, so a published
+                # snapshot is never modified by later polls
+                self._snapshot = SensorSample(accel, gyro, raw[3],
+                                              self.get_rotation_angles(accel, gyro, dt),
+                                              self.estimate_speed(accel))
+            except Exception as e:
+                self._log_error(f"Error processing sensor sample: {e}")
+    
+    def sample(self):
+        """Return the latest filtered sample without touching the I2C bus"""
+        return self._snapshot
+    
+    def stop(self):
+        """Stop the background polling thread"""
+        self._stop_event.set()
 
 class StarkHUDWidget(Widget):
     def __init__(self, **kwargs):
@@ -214,105 +357,317 @@ class StarkHUDWidget(Widget):
         self.scanning = True
         self.system_status = "ALL SYSTEMS NOMINAL"
         self.scan_angle = 0
-        self.data_points = []
+        # Fixed-length history for visualization, starting with neutral values
+        self.data_points = deque([0.5] * 30, maxlen=30)
         # Initialize the MPU6050 sensor
         self.mpu = MPU6050()
         
-        # Initialize data points for visualization
-        for _ in range(30):
-            self.data_points.append(0.5)  # Start with neutral values
-        Clock.schedule_interval(self.update, 1/30)  # 30 FPS update rate
+        # Compass and pitch ladder marks as (degrees, label); only major marks carry a label
+        self._heading_ticks = tuple(
+            (deg, f"{deg}°" if deg % 30 == 0 else None)
+            for deg in range(0, 360, 10))
+        self._ladder_rungs = tuple(
+            (degrees, f"{abs(degrees)}°" if degrees % 30 == 0 else None)
+            for degrees in range(-90, 91, 10) if degrees != 0)  # 0 is the horizon line
+        self._ladder_degrees = tuple(degrees for degrees, _ in self._ladder_rungs)
+        
+        # Sidebar scale ticks as (fraction of height, width factor, label)
+        self._power_ticks = tuple(
+            (i / 10, 1.0 if i % 5 == 0 else 0.7, f"{i*10}%" if i % 2 == 0 else None)
+            for i in range(11))  # 0% to 100% in steps of 10%
+        self._altitude_ticks = tuple(
+            (i / 10, 1.0 if i % 5 == 0 else 0.7, f"{i*20}m" if i % 2 == 0 else None)
+            for i in range(11))  # 0m to 200m in steps of 20m
+        
+        # Static layers are redrawn only on resize; the frame layer between
+        # them is the only thing rebuilt every tick
+        self._bg_group = Canvas()
+        self._fg_group = Canvas()
+        self._overlay_group = Canvas()
+        self.canvas.add(self._bg_group)
+        self.canvas.add(self._fg_group)
+        self.canvas.add(self._overlay_group)
+        
+        # The frame layer is built once. Elements with a fixed set of shapes are retained
+        # instructions whose points, size or texture are mutated in place;
+        # the heading marker labels, whose count varies, sit in their own
+        # canvas that is rebuilt only when the heading changes. The reticle and the
+        # pitch ladder sit under retained Rotates whose angles follow the scan
+        # and the roll
+        self._last_drawn = {}
+        with self._fg_group:
+            # Rotating reticle elements, spun by a retained Rotate
+            PushMatrix()
+            self._scan_rotate = Rotate(angle=0)
+            Color(0, 0.7, 0.9, 0.6)
+            self._reticle_mesh = Mesh(vertices=[], indices=[], mode='lines')
+            PopMatrix()
+            
+            # Heading markers (one line mesh), marker labels and readout
+            Color(0, 0.7, 0.9, 0.7)
+            self._heading_mesh = Mesh(vertices=[], indices=[], mode='lines')
+            self._heading_group = Canvas()
+            Color(1, 1, 1, 0.9)
+            self._heading_label = Rectangle(size=(0, 0))
+            
+            # Status text and speed
+            self._status_label = Rectangle(size=(0, 0))
+            self._speed_label = Rectangle(size=(0, 0))
+            
+            # Power level fill
+            Color(0, 0.7, 0.9, 0.6)
+            self._power_fill = Rectangle(size=(0, 0))
+            
+            # Altitude marker and readout
+            Color(1, 0.5, 0, 0.9)  # Restored orange-yellow
+            self._altitude_marker = Triangle(points=[0, 0, 0, 0, 0, 0])
+            Color(1, 1, 1, 0.9)
+            self._altitude_label = Rectangle(size=(0, 0))
+            
+            # Horizon line and pitch ladder, rotated with the roll
+            PushMatrix()
+            self._roll_rotate = Rotate(angle=0)
+            Color(1, 1, 1, 0.8)
+            self._horizon_line = Line(points=[0, 0, 0, 0], width=2)
+            self._ladder_mesh = Mesh(vertices=[], indices=[], mode='lines')
+            # One label per major rung, its texture rendered up front; the
+            # rectangles are only moved, or hidden outside the visible window
+            self._ladder_labels = {
+                degrees: Rectangle(texture=_label_texture(label_text, 10), size=(0, 0))
+                for degrees, label_text in self._ladder_rungs if label_text}
+            PopMatrix()
+            
+            # Attitude value readouts
+            Color(0, 0.7, 0.9, 0.9)
+            self._attitude_labels = [Rectangle(size=(0, 0)) for _ in range(3)]
+            
+            # Roll indicator arrow
+            Color(1, 0.8, 0.0, 0.9)  # Restored bright gold/yellow
+            self._roll_arrow = Triangle(points=[0, 0, 0, 0, 0, 0])
+            
+            # Data visualization on edges, 20 bars per side as one triangle
+            # mesh (two triangles per bar); bars start out with zero size
+            Color(0, 0.7, 0.9, 0.4)
+            self._data_mesh = Mesh(vertices=[0.0] * (40 * 4 * 4),
+                                   indices=[base + i for base in range(0, 40 * 4, 4) for i in (0, 1, 2, 2, 3, 0)],
+                                   mode='triangles')
+        
+        # Pitch ladder geometry relative to the horizon center, fixed once the
+        # label textures exist: (rung y offset, half line length, label or None,
+        # label x offset, label y offset). A pitch change then only shifts y
+        attitude_size = 180
+        pixels_per_degree = 2.5
+        ladder_geometry = []
+        for degrees, label_text in self._ladder_rungs:
+            half_length = attitude_size * (0.25 if label_text else 0.1)
+            label = self._ladder_labels.get(degrees)
+            label_dx = label_dy = 0
+            if label is not None:
+                # Text sits at the outer end of the line
+                texture = label.texture
+                label_dx = -half_length - texture.width - 5 if degrees > 0 else half_length + 5
+                label_dy = -texture.height / 2
+            ladder_geometry.append((degrees * pixels_per_degree, half_length, label, label_dx, label_dy))
+        self._ladder_geometry = tuple(ladder_geometry)
+        
+        self.bind(size=self._rebuild_bg)
+        self._rebuild_bg()
+        
+        # 20 FPS at rest; update() raises it to 30 FPS while locked on or turning
+        self._fast_cadence = False
+        self._frame_event = Clock.schedule_interval(self.update, 1/20)
         
     def update(self, dt):
-        # Get data from MPU6050
-        angles = self.mpu.get_rotation_angles()
-        self.pitch = angles['pitch']
-        self.roll = angles['roll']
-        # Update heading based on MPU6050 yaw rate
-        # In a real application, you would need to integrate the yaw rate over time
-        # This is simplified for demonstration
-        yaw_rate = angles['yaw']
-        self.yaw += yaw_rate * dt
+        # Get the latest MPU6050 snapshot - one sample feeds every consumer this frame
+        frame = self.mpu.sample()
+        
+        # Pick the render rate for the next frames
+        gx, gy, gz = frame.gyro
+        fast = self.target_locked or max(abs(gx), abs(gy), abs(gz)) > 5.0  # deg/s
+        if fast != self._fast_cadence:
+            self._fast_cadence = fast
+            self._frame_event.timeout = 1/30 if fast else 1/20
+        
+        # Yaw is already integrated from the gyro rate by the sensor's filter
+        self.pitch, self.roll, self.yaw = frame.attitude
         self.heading = self.yaw % 360  # Keep heading between 0-360
         
         # Update speed estimation
-        self.speed = self.mpu.estimate_speed()
+        self.speed = frame.speed
         
-        # Update scan animation
-        self.scan_angle = (self.scan_angle + 5) % 360
+        # Update scan animation at 150 deg/s, independent of the render rate
+        self.scan_angle = (self.scan_angle + 150 * dt) % 360
         
         # Update data visualization with newest sensor data
-        accel = self.mpu.read_accel_data()
-        gyro = self.mpu.read_gyro_data()
+        ax, ay, az = frame.accel
         
         # Update data points with normalized sensor values
-        new_point = (abs(accel['x']) + abs(accel['y']) + abs(accel['z'])) / 6.0  # Normalize to 0-1 range
-        self.data_points.append(new_point)
-        self.data_points.pop(0)  # Remove oldest point
+        new_point = (abs(ax) + abs(ay) + abs(az)) * (1.0 / 6.0)  # Normalize to 0-1 range
+        self.data_points.append(new_point)  # Oldest point drops off automatically
         
-        self.canvas.clear()
         self.draw_elements()
         
     def draw_elements(self):
         center_x = self.width / 2
         center_y = self.height / 2
         
-        with self.canvas:
+        # Rotating reticle elements - only the retained Rotate moves
+        self._scan_rotate.angle = self.scan_angle
+        
+        # Heading markers and readout
+        if self._changed('heading', round(self.heading, 1)):
+            self._heading_group.clear()
+            with self._heading_group:
+                self.draw_heading_arc(center_x, self.height - 50)
+        
+        # Status text and speed
+        if self._changed('status', (self.system_status, int(self.speed))):
+            self.draw_status_bar(center_x, 50)
+        
+        # Power level fill
+        if self._changed('power', self.power):
+            self.draw_power_indicator(60, center_y)
+        
+        # Altitude marker and readout
+        if self._changed('altitude', int(self.altitude)):
+            self.draw_altitude_indicator(self.width - 60, center_y)
+        
+        # Pitch and Roll attitude indicator - roll only moves the retained Rotate
+        self._roll_rotate.angle = self.roll
+        if self._changed('pitch_ladder', round(self.pitch, 1)):
+            self.draw_pitch_ladder(center_x, center_y)
+        if self._changed('attitude_values', (round(self.pitch, 1), round(self.roll, 1), round(self.yaw, 1))):
+            self.draw_attitude_values(center_x, center_y)
+        if self._changed('roll_arrow', round(self.roll, 1)):
+            self.draw_roll_arrow(center_x, center_y)
+        
+        # Data visualization on edges
+        if self._changed('data', tuple(self.data_points)):
+            self.draw_data_visualization()
+    
+    def _changed(self, name, key):
+        """Record the key of a dynamic element; False if it matches the last drawn frame"""
+        if self._last_drawn.get(name) == key:
+            return False
+        self._last_drawn[name] = key
+        return True
+    
+    def _rebuild_bg(self, *args):
+        """Redraw the static layers; only needed when the widget size changes"""
+        center_x = self.width / 2
+        center_y = self.height / 2
+        
+        # Dynamic elements are positioned from the size as well
+        self._scan_rotate.origin = (center_x, center_y)
+        self._roll_rotate.origin = (center_x, center_y)
+        self.draw_targeting_reticle(center_x, center_y)
+        self._last_drawn.clear()
+        
+        # Static parts are baked into an offscreen texture, so the background
+        # costs one textured quad per frame. The Fbo sits in the background
+        # group ahead of that quad, and Kivy re-renders it only when its
+        # contents change
+        self._bg_group.clear()
+        with self._bg_group:
+            self._bg_fbo = Fbo(size=(max(1, int(self.width)), max(1, int(self.height))))
+            Callback(_blend_premultiplied)
+            Color(1, 1, 1, 1)
+            Rectangle(texture=self._bg_fbo.texture, pos=(0, 0), size=self._bg_fbo.size)
+            Callback(_blend_default)
+        
+        # Static content is emitted grouped by color so each Color is set only once
+        with self._bg_fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+            Callback(_blend_into_texture)
+            
             # Background elements - hexagonal grid pattern
             Color(0, 0.7, 0.9, 0.1)  # Iron Man blue with low opacity
             self.draw_hex_grid(20, 20, center_x, center_y)
             
-            # Main targeting reticle
-            self.draw_targeting_reticle(center_x, center_y)
+            # Translucent panel backgrounds
+            Color(0, 0.7, 0.9, 0.2)
+            self.draw_heading_frame(center_x, self.height - 50)
+            self.draw_status_frame(center_x, 50)
+            self.draw_power_frame(60, center_y)
+            self.draw_altitude_frame(self.width - 60, center_y)
             
-            # Top arc with heading
-            self.draw_heading_arc(center_x, self.height - 50)
+            # Blue circles and roll scale
+            self.draw_reticle_frame(center_x, center_y)
+            self.draw_attitude_frame(center_x, center_y)
             
-            # Bottom status display
-            self.draw_status_bar(center_x, 50)
-            
-            # Left side power display
-            self.draw_power_indicator(60, center_y)
+            Color(1, 1, 1, 0.7)
+            self.draw_altitude_scale(self.width - 60, center_y)
             
-            # Right side altitude indicator
-            self.draw_altitude_indicator(self.width - 60, center_y)
-            
-            # Pitch and Roll attitude indicator
-            self.draw_attitude_indicator(center_x, center_y)
-            
-            # Data visualization on edges
-            self.draw_data_visualization()
+            Color(1, 1, 1, 0.9)
+            self.draw_reticle_center(center_x, center_y)
+            self.draw_heading_pointer(center_x, self.height - 50)
+            self.draw_altitude_title(self.width - 60, center_y)
+            Callback(_blend_default)
+        
+        # Static elements that must stay on top of the per-frame layer
+        self._overlay_group.clear()
+        with self._overlay_group:
+            self.draw_power_scale(60, center_y)
+            self.draw_aircraft_symbol(center_x, center_y)
 
     def draw_hex_grid(self, rows, cols, center_x, center_y):
+        vertices, indices = self._build_hex_grid(rows, cols, center_x, center_y)
+        if indices:
+            Mesh(vertices=vertices, indices=indices, mode='lines')
+
+    def _build_hex_grid(self, rows, cols, center_x, center_y):
+        """Return the (vertices, indices) of a line mesh holding every visible hexagon"""
         hex_size = 30
         width = hex_size * cols * 1.5
         height = hex_size * rows * 0.866 * 2
         
         start_x = center_x - width/2
         start_y = center_y - height/2
-                    
-        for row in range(rows):
-            for col in range(cols):
-                # Stagger every other row
-                offset_x = hex_size * 0.75 if row % 2 else 0
-                x = start_x + col * hex_size * 1.5 + offset_x
-                y = start_y + row * hex_size * 1.732
+        
+        # Every hexagon goes into one line mesh, so the whole grid is a single draw call
+        vertices = []
+        indices = []
+        
+        step_x = hex_size * 1.5
+        step_y = hex_size * 1.732
+        min_dist_sq = 100 * 100  # Squared radius of the clear area around the center
+        add_hexagon, floor, ceil = self.add_hexagon, math.floor, math.ceil  # Local aliases for the loop
+        
+        # Only visit the rows and columns whose centers can fall inside the widget
+        row_first = max(0, floor(-start_y / step_y) + 1)
+        row_last = min(rows, ceil((self.height - start_y) / step_y))
+        for row in range(row_first, row_last):
+            # Stagger every other row
+            row_x = start_x + (hex_size * 0.75 if row % 2 else 0)
+            y = start_y + row * step_y
+            dy = y - center_y
+            col_first = max(0, floor(-row_x / step_x) + 1)
+            col_last = min(cols, ceil((self.width - row_x) / step_x))
+            for col in range(col_first, col_last):
+                x = row_x + col * step_x
+                dx = x - center_x
                 # Only draw if in visible area and not in center (to keep center cleaner)
-                dist_from_center = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                if 0 < x < self.width and 0 < y < self.height and dist_from_center > 100:
-                    self.draw_hexagon(x, y, hex_size/3)
+                if 0 < x < self.width and 0 < y < self.height and dx*dx + dy*dy > min_dist_sq:
+                    add_hexagon(vertices, indices, x, y, hex_size/3)
+        
+        return vertices, indices
                     
-    def draw_hexagon(self, x, y, size):
-        points = []
+    def add_hexagon(self, vertices, indices, x, y, size):
+        """Append one hexagon outline to a line mesh's vertex and index lists"""
+        base = len(vertices) // 4  # 4 floats per vertex: x, y, u, v
+        for cx, cy in _HEX_CS:
+            vertices.extend((x + size * cx, y + size * cy, 0, 0))
         for i in range(6):
-            angle = math.radians(60 * i + 30)
-            points.extend([
-                x + size * math.cos(angle),
-                y + size * math.sin(angle)
-            ])
-        Line(points=points, width=1, close=True)
+            indices.extend((base + i, base + (i + 1) % 6))
+    
+    def add_segment(self, vertices, indices, x1, y1, x2, y2):
+        """Append one line segment to a line mesh's vertex and index lists"""
+        base = len(vertices) // 4
+        vertices.extend((x1, y1, 0, 0, x2, y2, 0, 0))
+        indices.extend((base, base + 1))
         
-    def draw_targeting_reticle(self, x, y):
+    def draw_reticle_frame(self, x, y):
         # Main targeting reticle - Iron Man style circular elements
         reticle_size = 120
         
@@ -320,75 +675,48 @@ class StarkHUDWidget(Widget):
         Color(0, 0.7, 0.9, 0.8)  # Iron Man blue
         Line(circle=(x, y, reticle_size), width=1.5)
         
-        # Inner rotating elements
-        Color(0, 0.7, 0.9, 0.6)
-        
         # Inner circle
+        Color(0, 0.7, 0.9, 0.6)
         Line(circle=(x, y, reticle_size * 0.7), width=1)
-        
-        # Dynamic rotating elements
-        PushMatrix()
-        Rotate(origin=(x, y), angle=self.scan_angle)
-        
-        # Tick marks around inner circle
-        for angle in range(0, 360, 30):
-            rad = math.radians(angle)
-            inner_r = reticle_size * 0.7
-            outer_r = reticle_size * 0.8
-            x1 = x + inner_r * math.cos(rad)
-            y1 = y + inner_r * math.sin(rad)
-            x2 = x + outer_r * math.cos(rad)
-            y2 = y + outer_r * math.sin(rad)
-            Line(points=[x1, y1, x2, y2], width=1)
-        
-        # Crosshairs
-        Line(points=[x - reticle_size*0.5, y, x - reticle_size*0.2, y], width=1)
-        Line(points=[x + reticle_size*0.2, y, x + reticle_size*0.5, y], width=1)
-        Line(points=[x, y - reticle_size*0.5, x, y - reticle_size*0.2], width=1)
-        Line(points=[x, y + reticle_size*0.2, x, y + reticle_size*0.5], width=1)
-        PopMatrix()
-        
-        # Central dynamic element
-        Color(1, 1, 1, 0.9)
+
+    def draw_reticle_center(self, x, y):
+        # Central element (white, color set by the caller)
         reticle_inner = 15
         Line(circle=(x, y, reticle_inner), width=1)
         
-        # Small triangles at cardinal points
+        # Small triangles at cardinal points, from the fixed template table
         triangle_size = 5
-        for angle in [0, 90, 180, 270]:
-            rad = math.radians(angle)
-            tx = x + reticle_inner * math.cos(rad)
-            ty = y + reticle_inner * math.sin(rad)
-            
-            # Triangle points
-            p1x = tx - triangle_size/2
-            p1y = ty - triangle_size/2
-            p2x = tx + triangle_size/2
-            p2y = ty - triangle_size/2
-            p3x = tx
-            p3y = ty + triangle_size/2
-            
-            # Rotate points based on angle
-            if angle == 0:  # Right
-                p1x, p1y = tx, ty - triangle_size/2
-                p2x, p2y = tx, ty + triangle_size/2
-                p3x, p3y = tx + triangle_size, ty
-            elif angle == 90:  # Top
-                p1x, p1y = tx - triangle_size/2, ty
-                p2x, p2y = tx + triangle_size/2, ty
-                p3x, p3y = tx, ty + triangle_size
-            elif angle == 180:  # Left
-                p1x, p1y = tx, ty - triangle_size/2
-                p2x, p2y = tx, ty + triangle_size/2
-                p3x, p3y = tx - triangle_size, ty
-            else:  # Bottom
-                p1x, p1y = tx - triangle_size/2, ty
-                p2x, p2y = tx + triangle_size/2, ty
-                p3x, p3y = tx, ty - triangle_size
-            
-            Triangle(points=[p1x, p1y, p2x, p2y, p3x, p3y])
+        for dir_x, dir_y, (dx1, dy1, dx2, dy2, dx3, dy3) in _CARDINAL_TRIS:
+            tx = x + reticle_inner * dir_x
+            ty = y + reticle_inner * dir_y
+            Triangle(points=[tx + dx1*triangle_size, ty + dy1*triangle_size,
+                             tx + dx2*triangle_size, ty + dy2*triangle_size,
+                             tx + dx3*triangle_size, ty + dy3*triangle_size])
 
-    def draw_attitude_indicator(self, x, y):
+    def draw_targeting_reticle(self, x, y):
+        # Inner rotating elements: one line mesh drawn unrotated around the
+        # center; the retained scan Rotate in front of it spins it each frame
+        reticle_size = 120
+        inner_r = reticle_size * 0.7
+        outer_r = reticle_size * 0.8
+        vertices = []
+        indices = []
+        
+        # Tick marks
+        for cos_a, sin_a in _RETICLE_TICKS:
+            self.add_segment(vertices, indices, x + inner_r * cos_a, y + inner_r * sin_a,
+                             x + outer_r * cos_a, y + outer_r * sin_a)
+        
+        # Crosshairs
+        self.add_segment(vertices, indices, x - reticle_size*0.5, y, x - reticle_size*0.2, y)
+        self.add_segment(vertices, indices, x + reticle_size*0.2, y, x + reticle_size*0.5, y)
+        self.add_segment(vertices, indices, x, y - reticle_size*0.5, x, y - reticle_size*0.2)
+        self.add_segment(vertices, indices, x, y + reticle_size*0.2, x, y + reticle_size*0.5)
+        
+        self._reticle_mesh.vertices = vertices
+        self._reticle_mesh.indices = indices
+
+    def draw_attitude_frame(self, x, y):
         # Artificial horizon / attitude indicator
         attitude_size = 180  # Size of the attitude indicator
         
@@ -396,49 +724,36 @@ class StarkHUDWidget(Widget):
         Color(0, 0.7, 0.9, 0.7)
         Line(circle=(x, y, attitude_size), width=1.5)
         
-        # Save state before rotation
-        PushMatrix()
-        # Apply roll rotation
-        Rotate(origin=(x, y), angle=self.roll)
+        # Draw roll indicator at the top of the attitude indicator
+        roll_indicator_radius = attitude_size + 15
         
-        # Calculate pitch offset (pixels per degree)
-        pixels_per_degree = 2.5
-        pitch_offset = self.pitch * pixels_per_degree
+        # Draw roll scale arc
+        Color(0, 0.7, 0.9, 0.5)
         
-        # Horizon line
-        Color(1, 1, 1, 0.8)
-        Line(points=[x - attitude_size, y - pitch_offset, 
-                     x + attitude_size, y - pitch_offset], width=2)
-        
-        # Pitch ladder (lines above and below horizon)
-        for degrees in range(-90, 91, 10):
-            if degrees == 0:  # Skip 0 degrees (horizon already drawn)
-                continue
-                
-            # Calculate y position based on pitch
-            ladder_y = y - pitch_offset + degrees * pixels_per_degree
+        # Draw roll scale tick marks, batched into one line mesh
+        vertices = []
+        indices = []
+        for roll_angle, cos_a, sin_a in _ROLL_TICKS:
+            tick_x = x + roll_indicator_radius * cos_a
+            tick_y = y + roll_indicator_radius * sin_a
             
-            # Only draw if in visible range
-            if y - attitude_size <= ladder_y <= y + attitude_size:
-                # Determine line length based on angle
-                line_length = attitude_size * 0.5 if degrees % 30 == 0 else attitude_size * 0.2
-                
-                Line(points=[x - line_length/2, ladder_y, 
-                             x + line_length/2, ladder_y], width=1)
-                
-                # Add degree numbers for major angles
-                if degrees % 30 == 0:
-                    degree_label = CoreLabel(text=f"{abs(degrees)}°", font_size=10)
-                    degree_label.refresh()
-                    texture = degree_label.texture
-                    
-                    # Position text at the end of the line
-                    text_x = x - line_length/2 - texture.width - 5 if degrees > 0 else x + line_length/2 + 5
-                    Rectangle(pos=(text_x, ladder_y - texture.height/2),
-                              size=texture.size, texture=texture)
-        
-        PopMatrix()
+            # Longer ticks for major angles
+            tick_length = 10 if roll_angle % 30 == 0 else 5
+            inner_x = x + (roll_indicator_radius - tick_length) * cos_a
+            inner_y = y + (roll_indicator_radius - tick_length) * sin_a
+            
+            self.add_segment(vertices, indices, inner_x, inner_y, tick_x, tick_y)
+            
+            # Add labels for major tick marks
+            if roll_angle % 30 == 0 and roll_angle != 0:
+                texture = _label_texture(f"{abs(roll_angle)}", 10)
+                label_x = x + (roll_indicator_radius + 5) * cos_a - texture.width/2
+                label_y = y + (roll_indicator_radius + 5) * sin_a - texture.height/2
+                Rectangle(pos=(label_x, label_y), size=texture.size, texture=texture)
         
+        Mesh(vertices=vertices, indices=indices, mode='lines')
+
+    def draw_aircraft_symbol(self, x, y):
         # Draw fixed reference marker (aircraft symbol)
         Color(1, 0.8, 0.0, 0.9)  # Restored bright gold/yellow
         
@@ -452,105 +767,96 @@ class StarkHUDWidget(Widget):
         
         # Vertical stabilizer
         Line(points=[x, y, x, y - 10], width=2)
+
+    def draw_pitch_ladder(self, x, y):
+        # Drawn between the retained PushMatrix/roll Rotate/PopMatrix in the frame layer
+        attitude_size = 180  # Size of the attitude indicator
+        
+        # Calculate pitch offset (pixels per degree)
+        pixels_per_degree = 2.5
+        pitch_offset = self.pitch * pixels_per_degree
+        
+        # Horizon line (retained, color set in the frame layer)
+        self._horizon_line.points = [x - attitude_size, y - pitch_offset,
+                                     x + attitude_size, y - pitch_offset]
+        
+        # Only rungs within attitude_size of the center are visible, i.e. those
+        # within +/- visible_span degrees of the current pitch
+        visible_span = attitude_size / pixels_per_degree
+        first = bisect_left(self._ladder_degrees, self.pitch - visible_span)
+        last = bisect_right(self._ladder_degrees, self.pitch + visible_span)
+        
+        # Pitch ladder (lines above and below horizon); the rungs go into the
+        # retained line mesh and the retained labels are moved next to them,
+        # using the per-rung offsets precomputed in __init__
+        vertices = []
+        indices = []
+        add_segment = self.add_segment  # Local alias for the loop
+        horizon_y = y - pitch_offset
+        shown = set()
+        for rung_dy, half_length, label, label_dx, label_dy in self._ladder_geometry[first:last]:
+            ladder_y = horizon_y + rung_dy
+            add_segment(vertices, indices, x - half_length, ladder_y, x + half_length, ladder_y)
+            
+            # Add degree numbers for major angles
+            if label is not None:
+                label.pos = (x + label_dx, ladder_y + label_dy)
+                label.size = label.texture.size
+                shown.add(label)
+        
+        self._ladder_mesh.vertices = vertices
+        self._ladder_mesh.indices = indices
+        
+        # Hide the labels of rungs outside the window
+        for label in self._ladder_labels.values():
+            if label not in shown:
+                label.size = (0, 0)
+
+    def draw_attitude_values(self, x, y):
+        attitude_size = 180
         
         # Attitude values display
         value_x = x + attitude_size + 15
         value_y = y + 40
         spacing = 20
-        Color(0, 0.7, 0.9, 0.9)
-        
-        # Pitch value
-        pitch_text = f"PITCH: {self.pitch:.1f}°"
-        label = CoreLabel(text=pitch_text, font_size=12)
-        label.refresh()
-        texture = label.texture
-        Rectangle(pos=(value_x, value_y), size=texture.size, texture=texture)
-        
-        # Roll value
-        roll_text = f"ROLL: {self.roll:.1f}°"
-        label = CoreLabel(text=roll_text, font_size=12)
-        label.refresh()
-        texture = label.texture
-        Rectangle(pos=(value_x, value_y - spacing), size=texture.size, texture=texture)
-        
-        # Yaw value
-        yaw_text = f"YAW: {self.yaw:.1f}°"
-        label = CoreLabel(text=yaw_text, font_size=12)
-        label.refresh()
-        texture = label.texture
-        Rectangle(pos=(value_x, value_y - spacing*2), size=texture.size, texture=texture)
         
-        # Draw roll indicator at the top of the attitude indicator
-        roll_indicator_radius = attitude_size + 15
-        
-        # Draw roll scale arc
-        Color(0, 0.7, 0.9, 0.5)
-        
-        # Draw roll scale tick marks
-        for roll_angle in range(-60, 61, 10):
-            angle_rad = math.radians(roll_angle - 90)  # -90 to rotate to top
-            tick_x = x + roll_indicator_radius * math.cos(angle_rad)
-            tick_y = y + roll_indicator_radius * math.sin(angle_rad)
-            
-            # Longer ticks for major angles
-            tick_length = 10 if roll_angle % 30 == 0 else 5
-            inner_x = x + (roll_indicator_radius - tick_length) * math.cos(angle_rad)
-            inner_y = y + (roll_indicator_radius - tick_length) * math.sin(angle_rad)
-            
-            Line(points=[inner_x, inner_y, tick_x, tick_y], width=1)
-            
-            # Add labels for major tick marks
-            if roll_angle % 30 == 0 and roll_angle != 0:
-                label = CoreLabel(text=f"{abs(roll_angle)}", font_size=10)
-                label.refresh()
-                texture = label.texture
-                label_x = x + (roll_indicator_radius + 5) * math.cos(angle_rad) - texture.width/2
-                label_y = y + (roll_indicator_radius + 5) * math.sin(angle_rad) - texture.height/2
-                Rectangle(pos=(label_x, label_y), size=texture.size, texture=texture)
+        # Pitch, roll and yaw values, one retained rectangle per line
+        texts = (f"PITCH: {self.pitch:.1f}°", f"ROLL: {self.roll:.1f}°", f"YAW: {self.yaw:.1f}°")
+        for i, (label, text) in enumerate(zip(self._attitude_labels, texts)):
+            texture = _readout_texture(text, 12)
+            label.texture = texture
+            label.size = texture.size
+            label.pos = (value_x, value_y - spacing*i)
+
+    def draw_roll_arrow(self, x, y):
+        attitude_size = 180
         
         # Draw the roll indicator arrow
-        Color(1, 0.8, 0.0, 0.9)  # Restored bright gold/yellow
+        roll_indicator_radius = attitude_size + 15
         roll_rad = math.radians(self.roll - 90)  # -90 to rotate to top
         arrow_x = x + roll_indicator_radius * math.cos(roll_rad)
         arrow_y = y + roll_indicator_radius * math.sin(roll_rad)
         
         # Arrow shape
         triangle_size = 8
-        triangle_points = [
+        self._roll_arrow.points = [
             arrow_x, arrow_y,
             arrow_x - triangle_size/2, arrow_y - triangle_size,
             arrow_x + triangle_size/2, arrow_y - triangle_size
         ]
-        Triangle(points=triangle_points)
 
-    def draw_heading_arc(self, x, y):
+    def draw_heading_frame(self, x, y):
         arc_width = 400
         arc_height = 60
         
-        # Draw arc background
-        Color(0, 0.7, 0.9, 0.2)
+        # Draw arc background (panel color set by the caller)
         Rectangle(pos=(x - arc_width/2, y - arc_height/2),
                   size=(arc_width, arc_height))
+
+    def draw_heading_pointer(self, x, y):
+        arc_height = 60
         
-        # Draw heading markers
-        Color(0, 0.7, 0.9, 0.7)
-        for deg in range(0, 360, 10):
-            rel_pos = ((deg - self.heading) % 360) / 360
-            if 0.1 <= rel_pos <= 0.9:  # Only show portion of compass
-                marker_x = x - arc_width/2 + rel_pos * arc_width
-                marker_height = arc_height/4 if deg % 30 == 0 else arc_height/8
-                Line(points=[marker_x, y - marker_height/2, marker_x, y + marker_height/2], width=1)
-                
-                if deg % 30 == 0:
-                    # Add degree text
-                    label = CoreLabel(text=f"{deg}°", font_size=10)
-                    label.refresh()
-                    texture = label.texture
-                    Rectangle(pos=(marker_x - texture.width/2, y + marker_height), 
-                              size=texture.size, texture=texture)
-        
-        # Draw center heading indicator (triangle)
-        Color(1, 1, 1, 0.9)
+        # Draw center heading indicator (triangle, white set by the caller)
         triangle_size = 10
         triangle_points = [
             x, y + arc_height/2 + triangle_size,  # Top
@@ -558,157 +864,201 @@ class StarkHUDWidget(Widget):
             x + triangle_size/2, y + arc_height/2   # Bottom right
         ]
         Line(points=triangle_points, width=1.5, close=True)
+
+    def draw_heading_arc(self, x, y):
+        arc_width = 400
+        arc_height = 60
+        
+        # Draw heading markers into the retained line mesh and their labels into
+        # the group (color set before the mesh in the frame layer)
+        heading = self.heading
+        vertices = []
+        indices = []
+        add_segment, rectangle, label_texture = self.add_segment, Rectangle, _label_texture  # Local aliases for the loop
+        
+        # Only show portion of compass: ticks 36 to 324 degrees ahead of the
+        # heading (10%-90% of the arc). Ticks are 10 degrees apart, so the
+        # visible ones are found directly from the nearest tick's offset
+        first_offset = (-heading) % 10  # Offset of the first tick at or ahead of the heading
+        first_index = round((heading + first_offset) / 10)
+        ticks = self._heading_ticks
+        left = x - arc_width/2
+        for step in range(math.ceil((36 - first_offset) / 10), math.floor((324 - first_offset) / 10) + 1):
+            rel_pos = (first_offset + step * 10) / 360
+            deg, label_text = ticks[(first_index + step) % 36]
+            marker_x = left + rel_pos * arc_width
+            marker_height = arc_height/4 if label_text else arc_height/8
+            add_segment(vertices, indices, marker_x, y - marker_height/2, marker_x, y + marker_height/2)
+            
+            if label_text:
+                # Add degree text
+                texture = label_texture(label_text, 10)
+                rectangle(pos=(marker_x - texture.width/2, y + marker_height), 
+                          size=texture.size, texture=texture)
         
-        # Current heading text
+        self._heading_mesh.vertices = vertices
+        self._heading_mesh.indices = indices
+        
+        # Current heading text (retained rectangle after the markers group)
         heading_text = f"HDG {int(self.heading)}°"
-        label = CoreLabel(text=heading_text, font_size=16)
-        label.refresh()
-        texture = label.texture
-        Rectangle(pos=(x - texture.width/2, y - 30), size=texture.size, texture=texture)
+        texture = _readout_texture(heading_text, 16)
+        self._heading_label.texture = texture
+        self._heading_label.size = texture.size
+        self._heading_label.pos = (x - texture.width/2, y - 30)
 
-    def draw_status_bar(self, x, y):
+    def draw_status_frame(self, x, y):
         bar_width = 500
         bar_height = 30
         
-        # Status bar background
-        Color(0, 0.7, 0.9, 0.2)
+        # Status bar background (panel color set by the caller)
         Rectangle(pos=(x - bar_width/2, y - bar_height/2),
                   size=(bar_width, bar_height))
+
+    def draw_status_bar(self, x, y):
+        bar_width = 500
         
         # Status text
-        Color(1, 1, 1, 0.9)
-        label = CoreLabel(text=self.system_status, font_size=14)
-        label.refresh()
-        texture = label.texture
-        Rectangle(pos=(x - texture.width/2, y - texture.height/2), 
-                  size=texture.size, texture=texture)
+        texture = _readout_texture(self.system_status, 14)
+        self._status_label.texture = texture
+        self._status_label.size = texture.size
+        self._status_label.pos = (x - texture.width/2, y - texture.height/2)
         
         # Speed indicator on the left
         speed_x = x - bar_width/2 - 80
-        speed_text = f"SPD: {self.speed} KM/H"
-        speed_label = CoreLabel(text=speed_text, font_size=14)
-        speed_label.refresh()
-        texture = speed_label.texture
-        Rectangle(pos=(speed_x - texture.width/2, y - texture.height/2), 
-                  size=texture.size, texture=texture)
+        speed_text = f"SPD: {int(self.speed)} KM/H"
+        texture = _readout_texture(speed_text, 14)
+        self._speed_label.texture = texture
+        self._speed_label.size = texture.size
+        self._speed_label.pos = (speed_x - texture.width/2, y - texture.height/2)
 
-    def draw_power_indicator(self, x, y):
+    def draw_power_frame(self, x, y):
         indicator_height = 300
         indicator_width = 40
         
-        # Background
-        Color(0, 0.7, 0.9, 0.2)
+        # Background (panel color set by the caller)
         Rectangle(pos=(x - indicator_width/2, y - indicator_height/2),
                   size=(indicator_width, indicator_height))
+
+    def draw_power_indicator(self, x, y):
+        indicator_height = 300
+        indicator_width = 40
         
         # Power level
-        Color(0, 0.7, 0.9, 0.6)
         power_height = (self.power / 100) * indicator_height
-        Rectangle(pos=(x - indicator_width/2, y - indicator_height/2),
-                  size=(indicator_width, power_height))
+        self._power_fill.pos = (x - indicator_width/2, y - indicator_height/2)
+        self._power_fill.size = (indicator_width, power_height)
+
+    def draw_power_scale(self, x, y):
+        indicator_height = 300
+        indicator_width = 40
         
         # Ticks
         Color(1, 1, 1, 0.7)
-        for i in range(11):  # 0% to 100% in steps of 10%
-            tick_y = y - indicator_height/2 + (i/10) * indicator_height
-            tick_width = indicator_width if i % 5 == 0 else indicator_width * 0.7
+        bottom = y - indicator_height/2
+        for fraction, width_factor, label_text in self._power_ticks:
+            tick_y = bottom + fraction * indicator_height
+            tick_width = indicator_width * width_factor
             Line(points=[x - tick_width/2, tick_y, x + tick_width/2, tick_y], width=1)
             
-            if i % 2 == 0:
+            if label_text:
                 # Add percentage text
-                label = CoreLabel(text=f"{i*10}%", font_size=10)
-                label.refresh()
-                texture = label.texture
+                texture = _label_texture(label_text, 10)
                 Rectangle(pos=(x - indicator_width/2 - texture.width - 5, tick_y - texture.height/2), 
                           size=texture.size, texture=texture)
         
         # Power text at top
-        label = CoreLabel(text="POWER", font_size=12)
-        label.refresh()
-        texture = label.texture
+        texture = _label_texture("POWER", 12)
         Rectangle(pos=(x - texture.width/2, y + indicator_height/2 + 5), 
                   size=texture.size, texture=texture)
 
-    def draw_altitude_indicator(self, x, y):
+    def draw_altitude_frame(self, x, y):
         indicator_height = 300
         indicator_width = 40
         
-        # Background
-        Color(0, 0.7, 0.9, 0.2)
+        # Background (panel color set by the caller)
         Rectangle(pos=(x - indicator_width/2, y - indicator_height/2),
                   size=(indicator_width, indicator_height))
+
+    def draw_altitude_scale(self, x, y):
+        indicator_height = 300
+        indicator_width = 40
         
-        # Altitude ticks
-        Color(1, 1, 1, 0.7)
-        for i in range(11):  # 0m to 200m in steps of 20m
-            tick_y = y - indicator_height/2 + (i/10) * indicator_height
-            tick_width = indicator_width if i % 5 == 0 else indicator_width * 0.7
+        # Altitude ticks (white set by the caller)
+        bottom = y - indicator_height/2
+        for fraction, width_factor, label_text in self._altitude_ticks:
+            tick_y = bottom + fraction * indicator_height
+            tick_width = indicator_width * width_factor
             Line(points=[x - tick_width/2, tick_y, x + tick_width/2, tick_y], width=1)
             
-            if i % 2 == 0:
+            if label_text:
                 # Add altitude text
-                alt_value = i * 20  # 0, 40, 80, etc.
-                label = CoreLabel(text=f"{alt_value}m", font_size=10)
-                label.refresh()
-                texture = label.texture
+                texture = _label_texture(label_text, 10)
                 Rectangle(pos=(x + indicator_width/2 + 5, tick_y - texture.height/2), 
                           size=texture.size, texture=texture)
         
+    def draw_altitude_title(self, x, y):
+        indicator_height = 300
+        
+        # Altitude text at top (white set by the caller)
+        texture = _label_texture("ALTITUDE", 12)
+        Rectangle(pos=(x - texture.width/2, y + indicator_height/2 + 5), 
+                  size=texture.size, texture=texture)
+
+    def draw_altitude_indicator(self, x, y):
+        indicator_height = 300
+        indicator_width = 40
+        
         # Current altitude marker - restored to orange
         marker_y = y - indicator_height/2 + (self.altitude / 200) * indicator_height
-        Color(1, 0.5, 0, 0.9)  # Restored orange-yellow
         triangle_size = 8
-        triangle_points = [
+        self._altitude_marker.points = [
             x - indicator_width/2 - triangle_size, marker_y,  # Left
             x - indicator_width/2, marker_y + triangle_size/2,  # Top
             x - indicator_width/2, marker_y - triangle_size/2   # Bottom
         ]
-        Triangle(points=triangle_points)
-        
-        # Altitude text at top:
-        Color(1, 1, 1, 0.9)
-        label = CoreLabel(text="ALTITUDE", font_size=12)
-        label.refresh()
-        texture = label.texture
-        Rectangle(pos=(x - texture.width/2, y + indicator_height/2 + 5), 
-                  size=texture.size, texture=texture)
         
         # Current altitude
-        alt_text = f"{self.altitude}m"
-        label = CoreLabel(text=alt_text, font_size=14)
-        label.refresh()
-        texture = label.texture
-        Rectangle(pos=(x - texture.width/2, y - indicator_height/2 - 25), 
-                  size=texture.size, texture=texture)
+        alt_text = f"{int(self.altitude)}m"
+        texture = _readout_texture(alt_text, 14)
+        self._altitude_label.texture = texture
+        self._altitude_label.size = texture.size
+        self._altitude_label.pos = (x - texture.width/2, y - indicator_height/2 - 25)
 
     def draw_data_visualization(self):
-        # Data visualization bars along the edges
-        Color(0, 0.7, 0.9, 0.4)
-        
-        # Left edge
+        # Data visualization bars along the edges, written as quads into the
+        # retained mesh; data_points always holds 30 values
         bar_width = 5
         bar_spacing = 10
-        num_bars = min(len(self.data_points), 20)
+        points = list(self.data_points)  # Snapshot for indexed access
+        vertices = []
+        extend = vertices.extend  # Local alias for the loops
+        y = 120
         
-        for i in range(num_bars):
-            height = self.data_points[i] * 50
+        # Left edge
+        for i in range(20):
+            top = y + points[i] * 50
             x = 10 + i * (bar_width + bar_spacing)
-            y = 120
-            Rectangle(pos=(x, y), size=(bar_width, height))
+            extend((x, y, 0, 0, x + bar_width, y, 0, 0,
+                    x + bar_width, top, 0, 0, x, top, 0, 0))
         
         # Right edge
-        for i in range(num_bars):
-            height = self.data_points[(i+10) % len(self.data_points)] * 50
+        for i in range(20):
+            top = y + points[(i+10) % len(points)] * 50
             x = self.width - 10 - (i+1) * (bar_width + bar_spacing)
-            y = 120
-            Rectangle(pos=(x, y), size=(bar_width, height))
+            extend((x, y, 0, 0, x + bar_width, y, 0, 0,
+                    x + bar_width, top, 0, 0, x, top, 0, 0))
+        
+        self._data_mesh.vertices = vertices
 
 class StarkHUDApp(App):
     def build(self):
         root = FloatLayout()
-        hud = StarkHUDWidget()
-        root.add_widget(hud)
+        self.hud = StarkHUDWidget()
+        root.add_widget(self.hud)
         return root
 
+    def on_stop(self):
+        self.hud.mpu.stop()
+
 if __name__ == '__main__':
     StarkHUDApp().run()
\ No newline at end of file